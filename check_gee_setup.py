@@ -3,6 +3,8 @@ Google Earth Engine Setup Checker
 Verifies GEE configuration and tests connection
 """
 
+import importlib.metadata
+import importlib.util
 import os
 import sys
 from pathlib import Path
@@ -26,14 +28,12 @@ def check_environment():
     env_path = Path('.env')
     if env_path.exists():
         with open(env_path) as f:
-            content = f.read()
-            if 'GEE_PROJECT_ID' in content:
-                # Extract project ID
-                for line in content.split('\n'):
-                    if line.startswith('GEE_PROJECT_ID='):
-                        project_id = line.split('=')[1].strip()
-                        print(f"   ✓ Project ID found: {project_id}")
-                        break
+            # Stop at the first GEE_PROJECT_ID line instead of reading the whole file
+            for line in f:
+                if line.startswith('GEE_PROJECT_ID='):
+                    project_id = line.partition('=')[2].strip()
+                    print(f"   ✓ Project ID found: {project_id}")
+                    break
             else:
                 print("   ✗ GEE_PROJECT_ID not found in .env")
                 return False
@@ -43,26 +43,26 @@ def check_environment():
     
     # Check Python packages
     print("\n2. Checking Python dependencies...")
-    try:
-        import ee
-        print(f"   ✓ earthengine-api: {ee.__version__ if hasattr(ee, '__version__') else 'installed'}")
-    except ImportError:
+    # Only probe for the packages here; importing geemap/geopandas is slow
+    # and test_gee_connection() imports ee itself when it is needed.
+    if importlib.util.find_spec('ee') is None:
         print("   ✗ earthengine-api not installed")
         return False
-    
     try:
-        import geemap
-        print(f"   ✓ geemap: installed")
-    except ImportError:
+        ee_version = importlib.metadata.version('earthengine-api')
+    except importlib.metadata.PackageNotFoundError:
+        ee_version = 'installed'
+    print(f"   ✓ earthengine-api: {ee_version}")
+    
+    if importlib.util.find_spec('geemap') is None:
         print("   ✗ geemap not installed")
         return False
+    print(f"   ✓ geemap: installed")
     
-    try:
-        import geopandas
-        print(f"   ✓ geopandas: installed")
-    except ImportError:
+    if importlib.util.find_spec('geopandas') is None:
         print("   ✗ geopandas not installed")
         return False
+    print(f"   ✓ geopandas: installed")
     
     return True
 